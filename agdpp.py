@@ -1,3 +1,6 @@
+from gameloop import EVENT_JOYSTICK_DOWN
+from gameloop import EVENT_KEYDOWN
+from gameloop import EVENT_KEYUP
 from gameloop import ExitGameLoop
 from gameloop import GameLoop
 from gameloop import KEY_LEFT
@@ -101,12 +104,17 @@ class BalloonShooter:
     True
     """
 
+    MAX_UPDATE_DT = 20
+    MAX_UPDATE_STEPS = 5
+
     @staticmethod
     def create(scene=None):
         return BalloonShooter(loop=GameLoop.create(), scene=scene)
 
     @staticmethod
-    def run_in_test_mode(events=[]):
+    def run_in_test_mode(events=None):
+        if events is None:
+            events = []
         loop = GameLoop.create_null(
             events=events+[
                 [GameLoop.create_event_user_closed_window()],
@@ -131,10 +139,42 @@ class BalloonShooter:
         self.game_scene.event(event)
 
     def tick(self, dt):
-        self.game_scene.update(dt)
+        self.update(dt)
         self.loop.clear_screen()
         self.game_scene.draw(self.loop)
 
+    def update(self, dt):
+        """
+        I update the scene in steps of at most MAX_UPDATE_DT so that arrows
+        don't skip past balloons when a frame takes long:
+
+        >>> class TestScene:
+        ...     def update(self, dt):
+        ...         print(f"update {dt}")
+        >>> game = BalloonShooter(loop=None, scene=TestScene())
+        >>> game.update(45)
+        update 20
+        update 20
+        update 5
+        >>> game.update(0)
+        update 0
+
+        After a long stall, I only catch up MAX_UPDATE_STEPS steps so that
+        updating doesn't make the next frame slow too:
+
+        >>> game.update(1000)
+        update 20
+        update 20
+        update 20
+        update 20
+        update 20
+        """
+        dt = min(dt, self.MAX_UPDATE_DT*self.MAX_UPDATE_STEPS)
+        while dt > self.MAX_UPDATE_DT:
+            self.game_scene.update(self.MAX_UPDATE_DT)
+            dt -= self.MAX_UPDATE_DT
+        self.game_scene.update(dt)
+
 class GameScene:
 
     """
@@ -167,6 +207,7 @@ class GameScene:
     def __init__(self, screen_area):
         self.screen_area = screen_area
         self.active_scene = StartScene(screen_area=self.screen_area)
+        self.in_start_scene = True
 
     def event(self, event):
         if event.is_user_closed_window() or event.is_joystick_down(XBOX_START):
@@ -175,12 +216,12 @@ class GameScene:
 
     def update(self, dt):
         self.active_scene.update(dt)
-        if isinstance(self.active_scene, StartScene):
-            if self.active_scene.get_players():
-                self.active_scene = GameplayScene(
-                    screen_area=self.screen_area,
-                    players=self.active_scene.get_players()
-                )
+        if self.in_start_scene and self.active_scene.get_players():
+            self.active_scene = GameplayScene(
+                screen_area=self.screen_area,
+                players=self.active_scene.get_players()
+            )
+            self.in_start_scene = False
 
     def draw(self, loop):
         self.active_scene.draw(loop)
@@ -207,6 +248,24 @@ class StartScene(SpriteGroup):
     ['joystick7']
     """
 
+    LINE_HEIGHT = 50
+
+    CONTROLS_LINES = [
+        (Point(x=800, y=400+index*25), line)
+        for index, line in enumerate([
+            "           CONTROLS",
+            "",
+            "Shoot:",
+            "    Space / Xbox A",
+            "",
+            "Turn left:",
+            "    Left / Xbox left joystick left",
+            "",
+            "Turn right:",
+            "    Right / Xbox left joystick right",
+        ])
+    ]
+
     def __init__(self, screen_area):
         SpriteGroup.__init__(self)
         positions = [
@@ -223,6 +282,7 @@ class StartScene(SpriteGroup):
         ))
         self.input_handler = InputHandler()
         self.pending_players = []
+        self.pending_player_lines = []
         self.players = None
 
     def event(self, event):
@@ -235,7 +295,26 @@ class StartScene(SpriteGroup):
             if player in self.pending_players:
                 self.players = self.pending_players
             else:
-                self.pending_players.append(player)
+                self.add_pending_player(player)
+
+    def add_pending_player(self, player):
+        """
+        I prepare the text for a pending player once, when it is added:
+
+        >>> start = StartScene(screen_area=Rectangle.from_size(500, 500))
+        >>> start.add_pending_player("keyboard")
+        >>> start.add_pending_player("joystick7")
+        >>> for position, text in start.pending_player_lines:
+        ...     print(position, text)
+        Point(x=150, y=220) Player 1: keyboard (shoot to start game)
+        Point(x=150, y=270) Player 2: joystick7 (shoot to start game)
+        """
+        index = len(self.pending_players)
+        self.pending_players.append(player)
+        self.pending_player_lines.append((
+            Point(x=150, y=220+self.LINE_HEIGHT*index),
+            f"Player {index+1}: {player} (shoot to start game)",
+        ))
 
     def get_players(self):
         return self.players
@@ -248,34 +327,22 @@ class StartScene(SpriteGroup):
             size=70,
             color="darkblue"
         )
-        line_height = 50
         loop.draw_text(
             position=Point(x=100, y=150),
             text="Shoot to add player",
             size=50,
             color="darkred"
         )
-        for index, player in enumerate(self.pending_players):
+        for position, text in self.pending_player_lines:
             loop.draw_text(
-                position=Point(x=150, y=220+line_height*index),
-                text=f"Player {index+1}: {player} (shoot to start game)",
+                position=position,
+                text=text,
                 size=40,
                 color="darkred"
             )
-        for index, line in enumerate([
-            "           CONTROLS",
-            "",
-            "Shoot:",
-            "    Space / Xbox A",
-            "",
-            "Turn left:",
-            "    Left / Xbox left joystick left",
-            "",
-            "Turn right:",
-            "    Right / Xbox left joystick right",
-        ]):
+        for position, line in self.CONTROLS_LINES:
             loop.draw_text(
-                position=Point(x=800, y=400+index*25),
+                position=position,
                 text=line,
                 size=30,
                 color="white"
@@ -409,6 +476,27 @@ class GameplayScene(SpriteGroup):
 
     >>> game.update(0)
 
+    Hits overlapping balloons
+    -------------------------
+
+    >>> game = GameplayScene(
+    ...     screen_area=Rectangle.from_size(1280, 720),
+    ...     balloons=[Point(x=500, y=500), Point(x=510, y=500)],
+    ...     arrows=[Point(x=505, y=500)]
+    ... )
+    >>> game.update(0)
+
+    Only one balloon is popped by the arrow:
+
+    >>> game.get_score()
+    1
+    >>> len([
+    ...     balloon
+    ...     for balloon in game.get_balloons()
+    ...     if balloon.get_position().y == 500
+    ... ])
+    1
+
     Changing arrow angle
     ====================
 
@@ -441,9 +529,27 @@ class GameplayScene(SpriteGroup):
     Point(x=30.0, y=-70)
     >>> game.bow_for_player("two").get_position()
     Point(x=60.0, y=-70)
+
+    Unknown players get the bow of the first player:
+
+    >>> game.bow_for_player(None) is game.bow_for_player("one")
+    True
     """
 
-    def __init__(self, screen_area, balloons=[], arrows=[], players=["test_input_device"]):
+    BANG_SOUNDS = [
+        "bang1.wav",
+        "bang2.wav",
+        "bang3.wav",
+        "bang4.wav",
+    ]
+
+    def __init__(self, screen_area, balloons=None, arrows=None, players=None):
+        if balloons is None:
+            balloons = []
+        if arrows is None:
+            arrows = []
+        if players is None:
+            players = ["test_input_device"]
         SpriteGroup.__init__(self)
         self.screen_area = screen_area
         self.particles = self.add(ParticleEffects())
@@ -471,6 +577,7 @@ class GameplayScene(SpriteGroup):
                 position=bow_position,
                 color=colors.get_next()
             ))
+        self.default_player = players[0]
 
     def event(self, event):
         self.input_handler.event(event)
@@ -482,21 +589,20 @@ class GameplayScene(SpriteGroup):
         for player, turn_angle in self.input_handler.get_turn_angles().items():
             self.bow_for_player(player).turn(turn_angle)
         SpriteGroup.update(self, dt)
-        for arrow in self.flying_arrows.get_sprites():
+        points = 0
+        for arrow in self.flying_arrows.iter_sprites():
             hit_balloon = self.balloons.get_balloon_hit_by_arrow(arrow)
             if hit_balloon or arrow.is_outside_of(self.screen_area):
-                self.flying_arrows.remove(arrow)
+                self.flying_arrows.mark_for_removal(arrow)
             if hit_balloon:
                 for particle in hit_balloon.get_hit_particles():
                     self.particles.add(particle)
                 self.balloons.remove(hit_balloon)
-                self.score.add_points(1)
-                self.mixer.queue(random.choice([
-                    "bang1.wav",
-                    "bang2.wav",
-                    "bang3.wav",
-                    "bang4.wav",
-                ]))
+                points += 1
+                self.mixer.queue(random.choice(self.BANG_SOUNDS))
+        self.flying_arrows.remove_marked()
+        if points:
+            self.score.add_points(points)
 
     def draw(self, loop):
         SpriteGroup.draw(self, loop)
@@ -521,10 +627,9 @@ class GameplayScene(SpriteGroup):
         return self.bow_for_player(player).get_angle()
 
     def bow_for_player(self, player):
-        for input_id, bow in self.bows.items():
-            if input_id == player:
-                return bow
-        return bow
+        if player not in self.bows:
+            player = self.default_player
+        return self.bows[player]
 
     def get_particles(self):
         return self.particles.get_sprites()
@@ -590,9 +695,11 @@ class ParticleEffects(SpriteGroup):
 
     def update(self, dt):
         SpriteGroup.update(self, dt)
-        for particle in self.get_sprites():
-            if not particle.is_alive():
-                self.remove(particle)
+        self.sprites = [
+            particle
+            for particle in self.sprites
+            if particle.is_alive()
+        ]
 
 class Balloons(SpriteGroup):
 
@@ -635,65 +742,240 @@ class Balloons(SpriteGroup):
     False
     """
 
-    def __init__(self, positions=[], screen_area=Rectangle.from_size(500, 500), number_of_balloons=3):
+    GRID_THRESHOLD = 8
+
+    def __init__(self, positions=None, screen_area=Rectangle.from_size(500, 500), number_of_balloons=3):
+        if positions is None:
+            positions = []
+        self.grid = None
         SpriteGroup.__init__(self, [
             Balloon(position=position) for position in positions
         ])
         self.screen_area = screen_area
+        self.spawn_area = None
         self.number_of_balloons = number_of_balloons
 
+    def add(self, balloon):
+        if self.grid is not None:
+            self.grid.add(balloon)
+        return SpriteGroup.add(self, balloon)
+
+    def remove(self, balloon):
+        if self.grid is not None:
+            self.grid.remove(balloon)
+        SpriteGroup.remove(self, balloon)
+
     def update(self, dt):
-        SpriteGroup.update(self, dt)
-        for balloon in self.get_sprites():
-            if balloon.is_outside_of(self.screen_area):
-                self.remove(balloon)
-        while len(self.get_sprites()) < self.number_of_balloons:
+        if self.grid is not None:
+            self.grid.elapse(dt)
+        balloons = []
+        for balloon in self.sprites:
+            balloon.update(dt)
+            if not balloon.is_outside_of(self.screen_area):
+                balloons.append(balloon)
+            elif self.grid is not None:
+                self.grid.remove(balloon)
+        self.sprites = balloons
+        while len(self.sprites) < self.number_of_balloons:
             self.spawn_new()
 
     def get_balloon_hit_by_arrow(self, arrow):
-        for balloon in self.get_sprites():
-            if arrow.hits_baloon(balloon):
+        """
+        >>> balloons = Balloons(positions=[Point(x=10, y=10), Point(x=200, y=200)])
+        >>> balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=200, y=210))).get_position()
+        Point(x=200, y=200)
+        >>> balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=100, y=100))) is None
+        True
+
+        With many balloons, I only test the ones close to the arrow:
+
+        >>> balloons = Balloons(positions=[Point(x=100*i, y=100) for i in range(10)])
+        >>> balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=510, y=110))).get_position()
+        Point(x=500, y=100)
+        >>> balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=550, y=100))) is None
+        True
+        >>> balloons.remove(balloons.get_sprites()[5])
+        >>> balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=510, y=110))) is None
+        True
+
+        The grid is kept while balloons move, until they could have left the
+        neighbourhood they were binned in:
+
+        >>> balloons = Balloons(
+        ...     positions=[Point(x=100*i, y=100) for i in range(10)],
+        ...     screen_area=Rectangle.from_size(1280, 720)
+        ... )
+        >>> _ = balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=0, y=0)))
+        >>> grid = balloons.grid
+        >>> balloons.update(100)
+        >>> _ = balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=0, y=0)))
+        >>> balloons.grid is grid
+        True
+        >>> balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=500, y=140))).get_position()
+        Point(x=500, y=110.0)
+        >>> balloons.update(1000)
+        >>> _ = balloons.get_balloon_hit_by_arrow(Arrow(position=Point(x=0, y=0)))
+        >>> balloons.grid is grid
+        False
+        """
+        position = arrow.get_position()
+        for balloon in self.get_balloons_near(position):
+            if balloon.contains(position):
                 return balloon
 
+    def get_balloons_near(self, position):
+        if len(self.sprites) < self.GRID_THRESHOLD:
+            return self.sprites
+        if self.grid is None or not self.grid.has_slack():
+            self.grid = BalloonGrid(self.sprites)
+        return self.grid.get_balloons_near(position)
+
     def spawn_new(self):
-        x = self.screen_area.deflate(50).get_random_x()
+        if self.spawn_area is None:
+            self.spawn_area = self.screen_area.deflate(50)
+        x = self.spawn_area.get_random_x()
         self.add(Balloon(position=self.screen_area.topleft.set(x=x)))
 
+class BalloonGrid:
+
+    """
+    I bin balloons into square cells twice as large as the largest balloon
+    radius. A point can then only be inside balloons in its own or a
+    neighbouring cell:
+
+    >>> near = Balloon(position=Point(x=50, y=50))
+    >>> far = Balloon(position=Point(x=500, y=500))
+    >>> grid = BalloonGrid([near, far])
+    >>> grid.get_balloons_near(Point(x=90, y=90)) == [near]
+    True
+    >>> grid.get_balloons_near(Point(x=300, y=300))
+    []
+
+    That holds as long as balloons have moved at most one radius since they
+    were binned:
+
+    >>> grid.has_slack()
+    True
+    >>> grid.elapse(400)
+    >>> grid.has_slack()
+    True
+    >>> grid.elapse(1)
+    >>> grid.has_slack()
+    False
+
+    Added and removed balloons are put into and taken out of their cell:
+
+    >>> grid.remove(near)
+    >>> grid.get_balloons_near(Point(x=90, y=90))
+    []
+    >>> grid.add(near)
+    >>> grid.get_balloons_near(Point(x=90, y=90)) == [near]
+    True
+    """
+
+    def __init__(self, balloons):
+        radius = max(balloon.radius for balloon in balloons)
+        self.cell_size = 2*radius
+        self.slack = radius
+        self.max_speed = 0
+        self.cells = {}
+        self.balloon_cells = {}
+        for balloon in balloons:
+            self.add(balloon)
+
+    def cell_for(self, position):
+        return (
+            int(position.x // self.cell_size),
+            int(position.y // self.cell_size),
+        )
+
+    def add(self, balloon):
+        cell = self.cell_for(balloon.get_position())
+        self.cells.setdefault(cell, []).append(balloon)
+        self.balloon_cells[balloon] = cell
+        self.max_speed = max(self.max_speed, balloon.speed)
+        if 2*balloon.radius > self.cell_size:
+            self.slack = -1
+
+    def remove(self, balloon):
+        self.cells[self.balloon_cells.pop(balloon)].remove(balloon)
+
+    def elapse(self, dt):
+        self.slack -= dt*self.max_speed
+
+    def has_slack(self):
+        return self.slack >= 0
+
+    def get_balloons_near(self, position):
+        cell_x, cell_y = self.cell_for(position)
+        balloons = []
+        for x in range(cell_x-1, cell_x+2):
+            for y in range(cell_y-1, cell_y+2):
+                balloons.extend(self.cells.get((x, y), []))
+        return balloons
+
 class InputHandler:
 
     def __init__(self):
+        self.shots = []
         self.shots_triggered = []
         self.turn_factors = {}
         self.turn_speed = 1/2500
 
     def event(self, event):
-        if event.is_keydown(KEY_SPACE):
-            self.shots_triggered.append("keyboard")
-        elif event.is_joystick_down(XBOX_A):
-            self.shots_triggered.append(self.joystick_id(event))
-        elif event.is_keydown(KEY_LEFT):
-            self.turn_factors["keyboard"] = -1
-        elif event.is_keyup(KEY_LEFT):
-            self.turn_factors["keyboard"] = 0
-        elif event.is_keydown(KEY_RIGHT):
-            self.turn_factors["keyboard"] = 1
-        elif event.is_keyup(KEY_RIGHT):
-            self.turn_factors["keyboard"] = 0
+        """
+        >>> i = InputHandler()
+        >>> i.event(GameLoop.create_event_keydown(KEY_RIGHT))
+        >>> i.turn_factors
+        {'keyboard': 1}
+        >>> i.event(GameLoop.create_event_keyup(KEY_RIGHT))
+        >>> i.turn_factors
+        {'keyboard': 0}
+        """
+        handler = self.DISPATCH.get(event.get_dispatch_key())
+        if handler:
+            handler(self, event)
         elif event.is_joystick_motion() and event.get_axis() == 0:
             if abs(event.get_value()) > 0.01:
                 self.turn_factors[self.joystick_id(event)] = event.get_value()
             else:
                 self.turn_factors[self.joystick_id(event)] = 0
 
+    def shoot_keyboard(self, event):
+        self.shots_triggered.append("keyboard")
+
+    def shoot_joystick(self, event):
+        self.shots_triggered.append(self.joystick_id(event))
+
+    def turn_keyboard_left(self, event):
+        self.turn_factors["keyboard"] = -1
+
+    def turn_keyboard_right(self, event):
+        self.turn_factors["keyboard"] = 1
+
+    def stop_turn_keyboard(self, event):
+        self.turn_factors["keyboard"] = 0
+
+    DISPATCH = {
+        (EVENT_KEYDOWN, KEY_SPACE): shoot_keyboard,
+        (EVENT_JOYSTICK_DOWN, XBOX_A): shoot_joystick,
+        (EVENT_KEYDOWN, KEY_LEFT): turn_keyboard_left,
+        (EVENT_KEYUP, KEY_LEFT): stop_turn_keyboard,
+        (EVENT_KEYDOWN, KEY_RIGHT): turn_keyboard_right,
+        (EVENT_KEYUP, KEY_RIGHT): stop_turn_keyboard,
+    }
+
     def joystick_id(self, event):
         return f"joystick{event.get_instance_id()}"
 
     def update(self, dt):
-        self.shots = self.shots_triggered
-        self.shots_triggered = []
+        self.shots, self.shots_triggered = self.shots_triggered, self.shots
+        self.shots_triggered.clear()
         self.turn_angles = {}
         for input_id, turn_factor in self.turn_factors.items():
-            self.turn_angles[input_id] = Angle.fraction_of_whole(turn_factor*dt*self.turn_speed)
+            fraction = turn_factor*dt*self.turn_speed
+            if fraction:
+                self.turn_angles[input_id] = Angle.fraction_of_whole(fraction)
 
     def get_shots(self):
         """
@@ -737,6 +1019,18 @@ class InputHandler:
         True
         >>> angles2["joystick7"] > angles1["joystick7"]
         True
+
+        Inputs that are not turning report no angle:
+
+        >>> i.event(GameLoop.create_event_keyup(KEY_LEFT))
+        >>> i.update(10)
+        >>> list(i.get_turn_angles().keys())
+        ['joystick7']
+
+        Angles returned earlier are not changed by later updates:
+
+        >>> list(angles1.keys())
+        ['keyboard', 'joystick7']
         """
         return self.turn_angles
 
@@ -756,9 +1050,12 @@ class Bow(SpriteGroup):
         Angle(degrees=-90)
         """
         new_angle = self.get_angle().add(angle)
-        if new_angle.to_unit_point().y < 0:
+        if new_angle.points_upward():
             self.arrow.set_angle(new_angle)
 
+    def update(self, dt):
+        pass
+
     def get_angle(self):
         return self.arrow.get_angle()
 
@@ -770,28 +1067,57 @@ class Bow(SpriteGroup):
 
 class Arrow:
 
+    __slots__ = (
+        "position",
+        "shooting",
+        "angle",
+        "direction",
+        "tail_offsets",
+        "color",
+    )
+
     def __init__(self, shooting=False, position=Point(x=600, y=600), angle=Angle.up(), color="blue"):
         self.position = position
         self.shooting = shooting
-        self.angle = angle
+        self.set_angle(angle)
         self.color = color
 
     def get_angle(self):
         return self.angle
 
     def set_angle(self, angle):
+        """
+        I precompute the direction vector and the tail offsets for the new
+        angle:
+
+        >>> arrow = Arrow(angle=Angle.zero())
+        >>> arrow.direction
+        Point(x=1.0, y=0.0)
+        >>> arrow.set_angle(Angle.fraction_of_whole(0.5))
+        >>> arrow.direction.x
+        -1.0
+        >>> arrow.tail_offsets[0].x
+        20.0
+        >>> arrow.tail_offsets[1].x
+        40.0
+        """
         self.angle = angle
+        self.direction = angle.to_unit_point()
+        self.tail_offsets = (
+            self.direction.times(-20),
+            self.direction.times(-40),
+        )
 
     def clone_shooting(self):
         """
         It preserves position and angle and set it to shooting:
 
-        >>> arrow = Arrow(position=Point(x=5, y=5), angle=-45, color='pink')
+        >>> arrow = Arrow(position=Point(x=5, y=5), angle=Angle(-45), color='pink')
         >>> new_arrow = arrow.clone_shooting()
         >>> new_arrow.get_position()
         Point(x=5, y=5)
         >>> new_arrow.angle
-        -45
+        Angle(degrees=-45)
         >>> new_arrow.shooting
         True
         >>> new_arrow.color
@@ -800,29 +1126,32 @@ class Arrow:
         return Arrow(shooting=True, position=self.position, angle=self.angle, color=self.color)
 
     def is_outside_of(self, screen_area):
-        return not screen_area.inflate(20).contains(self.position)
-
-    def hits_baloon(self, balloon):
-        return balloon.contains(self.position)
+        return not screen_area.contains(self.position, margin=20)
 
     def update(self, dt):
         if self.shooting:
-            self.position = self.position.add(self.angle.to_unit_point().times(dt))
+            self.position = Point(
+                x=self.position.x + self.direction.x*dt,
+                y=self.position.y + self.direction.y*dt
+            )
 
     def draw(self, loop):
-        v = self.angle.add(Angle.fraction_of_whole(0.5)).to_unit_point()
+        middle, tail = self.tail_offsets
         loop.draw_circle(self.position, color=self.color, radius=10)
-        loop.draw_circle(self.position.add(v.times(20)), color=self.color, radius=15)
-        loop.draw_circle(self.position.add(v.times(40)), color=self.color, radius=20)
+        loop.draw_circle(self.position.add(middle), color=self.color, radius=15)
+        loop.draw_circle(self.position.add(tail), color=self.color, radius=20)
 
     def get_position(self):
         return self.position
 
 class Balloon:
 
+    __slots__ = ("position", "radius", "radius_squared", "speed")
+
     def __init__(self, position, radius=40):
         self.position = position
         self.radius = radius
+        self.radius_squared = radius*radius
         self.speed = 0.1
 
     def get_hit_particles(self):
@@ -841,7 +1170,7 @@ class Balloon:
         ]
 
     def is_outside_of(self, screen_area):
-        return not screen_area.inflate(self.radius*2).contains(self.position)
+        return not screen_area.contains(self.position, margin=self.radius*2)
 
     def contains(self, position):
         """
@@ -850,8 +1179,28 @@ class Balloon:
         True
         >>> balloon.contains(Point(100, 100))
         False
+
+        On the edge:
+
+        >>> balloon.contains(Point(50, 70))
+        True
+        >>> balloon.contains(Point(50, 71))
+        False
+
+        Outside my bounding box:
+
+        >>> balloon.contains(Point(71, 50))
+        False
+        >>> balloon.contains(Point(65, 65))
+        False
         """
-        return self.position.distance_to(position) <= self.radius
+        dx = position.x - self.position.x
+        if dx > self.radius or dx < -self.radius:
+            return False
+        dy = position.y - self.position.y
+        if dy > self.radius or dy < -self.radius:
+            return False
+        return dx*dx + dy*dy <= self.radius_squared
 
     def update(self, dt):
         """
@@ -867,7 +1216,7 @@ class Balloon:
         >>> new_position.y > 50
         True
         """
-        self.position = self.position.move(dy=dt*self.speed)
+        self.position = Point(x=self.position.x, y=self.position.y+dt*self.speed)
 
     def draw(self, loop):
         loop.draw_circle(position=self.position, radius=self.radius)
@@ -910,6 +1259,8 @@ class BalloonParticle:
     Point(x=12, y=24)
     """
 
+    __slots__ = ("position", "radius", "velocity")
+
     def __init__(self, position, radius, velocity):
         self.position = position
         self.radius = radius
@@ -926,7 +1277,10 @@ class BalloonParticle:
 
     def update(self, dt):
         self.radius -= 0.05*dt
-        self.position = self.position.add(self.velocity.times(dt))
+        self.position = Point(
+            x=self.position.x + self.velocity.x*dt,
+            y=self.position.y + self.velocity.y*dt
+        )
 
     def draw(self, loop):
         loop.draw_circle(position=self.position, radius=self.radius)
@@ -968,24 +1322,38 @@ class Score(SpriteGroup):
         return self.score
 
     def count_medals(self):
-        return len(self.medals.get_sprites())
+        return self.medals.count()
 
     def get_medal_particles(self):
         return self.medal_particles.get_sprites()
 
 class ScoreText:
 
+    """
+    I convert the score to text only when it changes, not every frame:
+
+    >>> score_text = ScoreText()
+    >>> score_text.text
+    '0'
+    >>> score_text.set(5)
+    >>> score_text.text
+    '5'
+    """
+
+    POSITION = Point(x=1100, y=20)
+
     def __init__(self):
-        self.score = 0
+        self.set(0)
 
     def set(self, score):
         self.score = score
+        self.text = str(score)
 
     def update(self, dt):
         pass
 
     def draw(self, loop):
-        loop.draw_text(position=Point(x=1100, y=20), text=str(self.score))
+        loop.draw_text(position=self.POSITION, text=self.text)
 
 class Medal:
 
@@ -1045,6 +1413,8 @@ class MedalParticle:
     False
     """
 
+    __slots__ = ("position", "velocity", "radius", "color")
+
     def __init__(self):
         self.position = Point(
             x=1280//2,
@@ -1066,7 +1436,10 @@ class MedalParticle:
 
     def update(self, dt):
         self.radius -= 0.01*dt
-        self.position = self.position.add(self.velocity.times(dt))
+        self.position = Point(
+            x=self.position.x + self.velocity.x*dt,
+            y=self.position.y + self.velocity.y*dt
+        )
 
     def draw(self, loop):
         loop.draw_circle(position=self.position, radius=self.radius, color=self.color)
@@ -1091,10 +1464,12 @@ class ColorGenerator:
 
     def __init__(self):
         self.colors = ['blue', 'green', 'yellow']
+        self.index = 0
 
     def get_next(self):
-        if self.colors:
-            return self.colors.pop(0)
+        if self.index < len(self.colors):
+            self.index += 1
+            return self.colors[self.index-1]
         return 'black'
 
 class TestSceneScore:
@@ -7,6 +7,9 @@ KEY_LEFT = pygame.K_LEFT
 KEY_RIGHT = pygame.K_RIGHT
 XBOX_A = 0
 XBOX_START = 7
+EVENT_KEYDOWN = pygame.KEYDOWN
+EVENT_KEYUP = pygame.KEYUP
+EVENT_JOYSTICK_DOWN = pygame.JOYBUTTONDOWN
 
 class GameLoop(Observable):
 
@@ -45,12 +48,16 @@ class GameLoop(Observable):
         dt: 0
     """
 
+    TEXT_CACHE_SIZE = 64
+
     @staticmethod
     def create():
         return GameLoop(pygame)
 
     @staticmethod
-    def create_null(events=[]):
+    def create_null(events=None):
+        if events is None:
+            events = []
         class NullPygame:
             def __init__(self):
                 self.display = NullDisplay()
@@ -161,6 +168,11 @@ class GameLoop(Observable):
     def __init__(self, pygame):
         Observable.__init__(self)
         self.pygame = pygame
+        self.events = []
+        self.event_pool = []
+        self.axis_motion_indices = {}
+        self.joysticks = {}
+        self.text_surfaces = {}
 
     def run(self, game, resolution=(1280, 720), fps=60):
         self.notify("GAMELOOP_INIT", {"resolution": resolution, "fps": fps})
@@ -169,57 +181,151 @@ class GameLoop(Observable):
         self.pygame.mixer.init()
         self.screen = self.pygame.display.set_mode(resolution)
         clock = self.pygame.time.Clock()
+        poll_events = self.poll_events
+        game_event = game.event
+        game_tick = game.tick
+        display_flip = self.pygame.display.flip
+        clock_tick = clock.tick
         dt = 0
-        joysticks = {}
         try:
             while True:
-                for event in self.pygame.event.get():
-                    if event.type == pygame.JOYDEVICEADDED:
-                        joy = self.pygame.joystick.Joystick(event.device_index)
-                        joysticks[joy.get_instance_id()] = joy
-                    else:
-                        game.event(Event(event))
-                game.tick(dt)
-                self.pygame.display.flip()
-                dt = clock.tick(fps)
+                for event in poll_events():
+                    game_event(event)
+                game_tick(dt)
+                display_flip()
+                # Clock.tick sleeps until the next frame is due, so we don't
+                # spin between frames.
+                dt = clock_tick(fps)
         except ExitGameLoop:
             pass
         finally:
             self.notify("GAMELOOP_QUIT", {})
             self.pygame.quit()
 
+    def poll_events(self):
+        """
+        I fetch all queued events in one batch per frame and return them in a
+        list that is reused between frames:
+
+        >>> loop = GameLoop.create_null(events=[
+        ...     [
+        ...         GameLoop.create_event_keydown(KEY_LEFT),
+        ...         GameLoop.create_event_keyup(KEY_LEFT),
+        ...     ],
+        ...     [],
+        ... ])
+        >>> events = loop.poll_events()
+        >>> [event.is_keydown(KEY_LEFT) for event in events]
+        [True, False]
+        >>> loop.poll_events() is events
+        True
+        >>> events
+        []
+
+        The event objects are reused between frames as well, so they must not
+        be kept after the frame they were received in:
+
+        >>> loop = GameLoop.create_null(events=[
+        ...     [GameLoop.create_event_keydown(KEY_LEFT)],
+        ...     [GameLoop.create_event_keyup(KEY_LEFT)],
+        ... ])
+        >>> (first,) = loop.poll_events()
+        >>> (second,) = loop.poll_events()
+        >>> first is second
+        True
+        >>> second.is_keyup(KEY_LEFT)
+        True
+
+        Joystick axis motions report a position, so I only keep the latest
+        motion per joystick and axis in a frame:
+
+        >>> loop = GameLoop.create_null(events=[[
+        ...     GameLoop.create_event_joystick_motion(axis=0, value=0.1),
+        ...     GameLoop.create_event_joystick_motion(axis=1, value=0.2),
+        ...     GameLoop.create_event_joystick_motion(axis=0, value=0.3),
+        ...     GameLoop.create_event_joystick_motion(axis=0, value=0.4, instance_id=6),
+        ... ]])
+        >>> [
+        ...     (event.get_instance_id(), event.get_axis(), event.get_value())
+        ...     for event in loop.poll_events()
+        ... ]
+        [(5, 0, 0.3), (5, 1, 0.2), (6, 0, 0.4)]
+        """
+        self.events.clear()
+        self.axis_motion_indices.clear()
+        for event in self.pygame.event.get():
+            if event.type == pygame.JOYDEVICEADDED:
+                joy = self.pygame.joystick.Joystick(event.device_index)
+                self.joysticks[joy.get_instance_id()] = joy
+            elif event.type == pygame.JOYAXISMOTION:
+                axis = (event.instance_id, event.axis)
+                if axis in self.axis_motion_indices:
+                    self.events[self.axis_motion_indices[axis]].pygame_event = event
+                else:
+                    self.axis_motion_indices[axis] = len(self.events)
+                    self.events.append(self.wrap_event(event))
+            else:
+                self.events.append(self.wrap_event(event))
+        return self.events
+
+    def wrap_event(self, pygame_event):
+        index = len(self.events)
+        if index == len(self.event_pool):
+            self.event_pool.append(Event(pygame_event))
+        else:
+            self.event_pool[index].pygame_event = pygame_event
+        return self.event_pool[index]
+
     def load_sound(self, path):
         return Sound(self.pygame.mixer.Sound(path))
 
     def clear_screen(self):
-        self.notify("CLEAR_SCREEN", {})
+        if self.listeners:
+            self.notify("CLEAR_SCREEN", {})
         self.screen.fill("purple")
 
     def draw_circle(self, position, radius=40, color="red"):
-        self.notify("DRAW_CIRCLE", {
-            "x": int(position.x),
-            "y": int(position.y),
-            "radius": radius,
-            "color": color,
-        })
-        if position.x >= 0:
+        center = (int(position.x), int(position.y))
+        if self.listeners:
+            self.notify("DRAW_CIRCLE", {
+                "x": center[0],
+                "y": center[1],
+                "radius": radius,
+                "color": color,
+            })
+        if center[0] >= 0:
             # https://github.com/pygame/pygame/issues/3778
-            self.pygame.draw.circle(
-                self.screen,
-                color,
-                (int(position.x), int(position.y)),
-                radius
-            )
+            self.pygame.draw.circle(self.screen, color, center, radius)
 
     def draw_text(self, position, text, size=100, color="black"):
-        self.notify("DRAW_TEXT", {
-            "x": position.x,
-            "y": position.y,
-            "text": text,
-            "color": color,
-        })
-        f = self.pygame.font.Font(size=size)
-        surface = f.render(text, True, color)
+        """
+        I only render a text the first time it is drawn and blit the same
+        surface after that:
+
+        >>> from geometry import Point
+        >>> loop = GameLoop.create_null()
+        >>> loop.screen = loop.pygame.display.set_mode((1280, 720))
+        >>> loop.draw_text(Point(x=0, y=0), "1")
+        >>> loop.draw_text(Point(x=0, y=0), "1")
+        >>> loop.draw_text(Point(x=0, y=0), "2")
+        >>> sorted(loop.text_surfaces)
+        [('1', 100, 'black'), ('2', 100, 'black')]
+        """
+        if self.listeners:
+            self.notify("DRAW_TEXT", {
+                "x": position.x,
+                "y": position.y,
+                "text": text,
+                "color": color,
+            })
+        key = (text, size, color)
+        if key in self.text_surfaces:
+            surface = self.text_surfaces[key]
+        else:
+            if len(self.text_surfaces) >= self.TEXT_CACHE_SIZE:
+                self.text_surfaces.clear()
+            f = self.pygame.font.Font(size=size)
+            surface = self.text_surfaces[key] = f.render(text, True, color)
         self.screen.blit(surface, (position.x, position.y))
 
 class Sound:
@@ -250,6 +356,26 @@ class Event:
             self.pygame_event.button == button
         )
 
+    def get_dispatch_key(self):
+        """
+        I identify key and joystick button events by type and code so that
+        they can be dispatched with a single dict lookup:
+
+        >>> GameLoop.create_event_keydown(KEY_LEFT).get_dispatch_key() == (EVENT_KEYDOWN, KEY_LEFT)
+        True
+        >>> GameLoop.create_event_keyup(KEY_LEFT).get_dispatch_key() == (EVENT_KEYUP, KEY_LEFT)
+        True
+        >>> GameLoop.create_event_joystick_down(XBOX_A).get_dispatch_key() == (EVENT_JOYSTICK_DOWN, XBOX_A)
+        True
+        >>> GameLoop.create_event_joystick_motion().get_dispatch_key() is None
+        True
+        """
+        event = self.pygame_event
+        if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+            return (event.type, event.key)
+        elif event.type == pygame.JOYBUTTONDOWN:
+            return (event.type, event.button)
+
     def get_button(self):
         return self.pygame_event.button
 
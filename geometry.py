@@ -4,6 +4,8 @@ import random
 
 class Rectangle(namedtuple("Rectangle", "topleft,bottomright")):
 
+    __slots__ = ()
+
     @staticmethod
     def from_size(width, height):
         """
@@ -63,7 +65,7 @@ class Rectangle(namedtuple("Rectangle", "topleft,bottomright")):
             bottomright=self.bottomright.move(amount, amount),
         )
 
-    def contains(self, point):
+    def contains(self, point, margin=0):
         """
         >>> r = Rectangle.from_size(200, 100)
 
@@ -96,20 +98,31 @@ class Rectangle(namedtuple("Rectangle", "topleft,bottomright")):
 
         >>> r.contains(Point(x=0, y=101))
         False
+
+        I can check against an inflated version of myself without creating
+        it:
+
+        >>> r.contains(Point(x=-10, y=110), margin=10)
+        True
+        >>> r.contains(Point(x=-11, y=0), margin=10)
+        False
         """
-        if point.x < self.topleft.x:
-            return False
-        elif point.x > self.bottomright.x:
-            return False
-        elif point.y < self.topleft.y:
-            return False
-        elif point.y > self.bottomright.y:
-            return False
-        else:
-            return True
+        return (
+            self.topleft.x - margin <= point.x <= self.bottomright.x + margin and
+            self.topleft.y - margin <= point.y <= self.bottomright.y + margin
+        )
 
 class Point(namedtuple("Point", "x,y")):
 
+    """
+    I have no instance dictionary:
+
+    >>> hasattr(Point(x=0, y=0), "__dict__")
+    False
+    """
+
+    __slots__ = ()
+
     def distance_to(self, point):
         """
         >>> Point(0, 0).distance_to(Point(10, 0))
@@ -117,6 +130,15 @@ class Point(namedtuple("Point", "x,y")):
         """
         return self.vector_to(point).length()
 
+    def distance_squared_to(self, point):
+        """
+        >>> Point(0, 0).distance_squared_to(Point(3, 4))
+        25
+        """
+        dx = point.x - self.x
+        dy = point.y - self.y
+        return dx*dx + dy*dy
+
     def vector_to(self, point):
         return Point(x=point.x-self.x, y=point.y-self.y)
 
@@ -176,6 +198,8 @@ class Angle(namedtuple("Angle", "degrees")):
     True
     """
 
+    __slots__ = ()
+
     @staticmethod
     def up():
         return Angle(-90)
@@ -198,5 +222,24 @@ class Angle(namedtuple("Angle", "degrees")):
             y=math.sin(math.radians(self.degrees))
         )
 
+    def points_upward(self):
+        """
+        I tell if my unit point has a negative y coordinate, without trig:
+
+        >>> Angle.up().points_upward()
+        True
+        >>> Angle(-10).points_upward()
+        True
+        >>> Angle(350).points_upward()
+        True
+        >>> Angle.zero().points_upward()
+        False
+        >>> Angle(90).points_upward()
+        False
+        >>> Angle(-180).points_upward()
+        False
+        """
+        return 180 < self.degrees % 360 < 360
+
     def add(self, other):
         return Angle(self.degrees + other.degrees)
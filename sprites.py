@@ -20,27 +20,71 @@ class SpriteGroup:
     >>> group.draw(None)
     TEST SPRITE draw None
     TEST SPRITE draw None
+
+    Sprites marked for removal stay until removed in one pass:
+
+    >>> group.mark_for_removal(x)
+    >>> x in group.get_sprites()
+    True
+    >>> group.remove_marked()
+    >>> x in group.get_sprites()
+    False
+    >>> len(group.get_sprites())
+    1
     """
 
-    def __init__(self, sprites=[]):
+    def __init__(self, sprites=None):
         self.sprites = []
-        for sprite in sprites:
-            self.add(sprite)
+        self.marked_for_removal = []
+        if sprites is not None:
+            for sprite in sprites:
+                self.add(sprite)
 
     def add(self, sprite):
         self.sprites.append(sprite)
         return sprite
 
-    def update(self, *args, **kwargs):
+    def update(self, dt):
         for sprite in self.sprites:
-            sprite.update(*args, **kwargs)
+            sprite.update(dt)
 
-    def draw(self, *args, **kwargs):
+    def draw(self, loop):
         for sprite in self.sprites:
-            sprite.draw(*args, **kwargs)
+            sprite.draw(loop)
 
     def get_sprites(self):
         return list(self.sprites)
 
+    def iter_sprites(self):
+        """
+        I iterate my sprites without copying them, so the group must not be
+        changed while iterating:
+
+        >>> group = SpriteGroup(["a", "b"])
+        >>> list(group.iter_sprites())
+        ['a', 'b']
+        """
+        return iter(self.sprites)
+
+    def count(self):
+        """
+        >>> SpriteGroup(["a", "b"]).count()
+        2
+        """
+        return len(self.sprites)
+
     def remove(self, sprite):
         self.sprites.remove(sprite)
+
+    def mark_for_removal(self, sprite):
+        self.marked_for_removal.append(sprite)
+
+    def remove_marked(self):
+        if self.marked_for_removal:
+            marked = set(id(sprite) for sprite in self.marked_for_removal)
+            self.sprites = [
+                sprite
+                for sprite in self.sprites
+                if id(sprite) not in marked
+            ]
+            self.marked_for_removal = []
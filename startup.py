@@ -119,7 +119,9 @@ class StartupApplication:
         )
 
     @staticmethod
-    def run_in_test_mode(events=[], iterations=2):
+    def run_in_test_mode(events=None, iterations=2):
+        if events is None:
+            events = []
         loop = GameLoop.create_null(
             events=events+[
                 [GameLoop.create_event_user_closed_window()],
@@ -233,7 +235,7 @@ class StartupScene:
     def game_closest_to_cursor(self):
         return min(
             self.games,
-            key=lambda game: game.distance_to(self.cursor)
+            key=lambda game: game.distance_squared_to(self.cursor)
         )
 
     def event(self, event):
@@ -280,8 +282,8 @@ class Game:
             color="lightblue" if closest is self else "black"
         )
 
-    def distance_to(self, point):
-        return self.position.distance_to(point)
+    def distance_squared_to(self, point):
+        return self.position.distance_squared_to(point)
 
 class InifiteLoopCondition:
 